@@ -4,43 +4,378 @@ MergeMind - Premium Multi-Model AI Code Generator
 Created by Amit Kumar
 """
 
-# !pip install -U autogen-agentchat[gemini]~=0.2 gradio openai google-generativeai
+# !pip install -U gradio openai google-genai
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from pathlib import Path
+
+from google import genai
+from google.genai import errors as genai_errors
+from google.genai import types as genai_types
+from openai import (
+    APIConnectionError, APITimeoutError, AsyncOpenAI, InternalServerError, RateLimitError
+)
+
+# =========================
+# SDK clients
+# =========================
+# Every LLM call is bounded so a stalled provider cannot hang a worker;
+# transient failures are retried with exponential backoff plus jitter.
+# Validation pings are tiny, so they get a short timeout. Full code
+# generation legitimately takes minutes on large models, so it gets a
+# long one, and a timed-out generation is never re-sent (it would bill the
+# same expensive request again and most likely time out again).
+_PING_TIMEOUT = 30
+_GENERATION_TIMEOUT = 300
+_LLM_TRIES = 3
+_TIMEOUT_ERRORS = (asyncio.TimeoutError, APITimeoutError)
+_TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    APIConnectionError,
+    RateLimitError,
+    InternalServerError,
+    genai_errors.ServerError
+)
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, genai_errors.ClientError):
+        # Gemini reports rate limiting as a 429 client error.
+        return exc.code == 429
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
+
+def _describe_error(exc: Exception) -> str:
+    # Timeouts carry no message of their own.
+    return str(exc) or type(exc).__name__
+
+
+async def _with_retry(
+    coro_fn,
+    timeout: float = _PING_TIMEOUT,
+    retry_timeouts: bool = True,
+    tries: int = _LLM_TRIES
+):
+    """Await coro_fn() with a timeout, retrying transient errors."""
+    for attempt in range(tries):
+        try:
+            return await asyncio.wait_for(coro_fn(), timeout)
+        except Exception as e:
+            timed_out = isinstance(e, _TIMEOUT_ERRORS)
+            if attempt == tries - 1 or not _is_transient(e) or (timed_out and not retry_timeouts):
+                raise
+            await asyncio.sleep(2 ** attempt + random.random())
+
+
+# One client per key, so the validation ping and later requests share a
+# warm keep-alive connection pool instead of opening a new one per call.
+# The cached clients keep the raw key in process memory only.
+@functools.lru_cache(maxsize=32)
+def _get_async_openai_client(api_key: str):
+    # Retries are handled by _with_retry, which adds jitter.
+    # Pings override the timeout per request.
+    return AsyncOpenAI(api_key=api_key, timeout=_GENERATION_TIMEOUT, max_retries=0)
+
+
+# Each Gemini client carries its own key; nothing is configured globally,
+# so concurrent users never share credentials.
+@functools.lru_cache(maxsize=32)
+def _get_gemini_client(api_key: str):
+    return genai.Client(
+        api_key=api_key,
+        http_options=genai_types.HttpOptions(timeout=_GENERATION_TIMEOUT * 1000)
+    )
 
-from autogen import ConversableAgent, UserProxyAgent, GroupChat, GroupChatManager
-import gradio as gr
 
 # =========================
 # API KEY VALIDATION
 # =========================
-def validate_openai_key(api_key: str, model: str):
+# Successful validations are remembered for a while so repeat submissions
+# with the same credentials skip the "ping" round-trip. This cache records
+# keys only as SHA-256 digests; failures are never cached. (The per-key SDK
+# clients above do hold the raw key in memory while cached, but keys are
+# never written to disk.)
+_KEY_CACHE_TTL = 600
+_KEY_CACHE_MAXSIZE = 128
+_validated_keys = {}
+
+
+def _key_digest(provider: str, api_key: str, model: str) -> str:
+    return hashlib.sha256(f"{provider}|{api_key}|{model}".encode()).hexdigest()
+
+
+def _is_key_validated(digest: str) -> bool:
+    expires_at = _validated_keys.get(digest)
+    if expires_at is None:
+        return False
+    if expires_at < time.monotonic():
+        _validated_keys.pop(digest, None)
+        return False
+    return True
+
+
+def _remember_key(digest: str):
+    if len(_validated_keys) >= _KEY_CACHE_MAXSIZE:
+        _validated_keys.pop(next(iter(_validated_keys)), None)
+    _validated_keys[digest] = time.monotonic() + _KEY_CACHE_TTL
+
+
+# Models offered in the UI. Unknown names are rejected locally so a typo
+# does not cost a provider round-trip to discover.
+_OPENAI_MODELS = ("gpt-3.5-turbo", "gpt-4o", "gpt-4o-mini", "gpt-5", "gpt-5.1", "gpt-5.2")
+_GEMINI_MODELS = ("gemini-2.5-flash", "gemini-2.5-pro", "gemini-3-flash-preview")
+
+
+async def validate_openai_key(api_key: str, model: str):
+    if model not in _OPENAI_MODELS:
+        return False, f"❌ Unknown OpenAI model '{model}'. Choose one of: {', '.join(_OPENAI_MODELS)}"
+    digest = _key_digest("openai", api_key, model)
+    if _is_key_validated(digest):
+        return True, "✅ OpenAI key is valid"
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
-        client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": "ping"}],
-            max_tokens=1
-        )
+        client = _get_async_openai_client(api_key)
+        # Retrieving the model checks both the key and access to the model
+        # without generating tokens, and works for every model family
+        # (gpt-5 rejects the max_tokens a completion ping would need).
+        await _with_retry(lambda: client.models.retrieve(model, timeout=_PING_TIMEOUT))
+        _remember_key(digest)
         return True, "✅ OpenAI key is valid"
     except Exception as e:
-        return False, f"❌ OpenAI key invalid: {str(e)}"
+        if _is_transient(e):
+            return False, f"❌ Could not reach OpenAI: {_describe_error(e)}"
+        return False, f"❌ OpenAI key invalid: {_describe_error(e)}"
 
 
-def validate_gemini_key(api_key: str, model: str):
+async def validate_gemini_key(api_key: str, model: str):
+    if model not in _GEMINI_MODELS:
+        return False, f"❌ Unknown Gemini model '{model}'. Choose one of: {', '.join(_GEMINI_MODELS)}"
+    digest = _key_digest("gemini", api_key, model)
+    if _is_key_validated(digest):
+        return True, "✅ Gemini key is valid"
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=api_key)
-        model_obj = genai.GenerativeModel(model)
-        model_obj.generate_content("ping")
+        client = _get_gemini_client(api_key)
+        await _with_retry(lambda: client.aio.models.generate_content(
+            model=model,
+            contents="ping",
+            config=genai_types.GenerateContentConfig(max_output_tokens=1)
+        ))
+        _remember_key(digest)
         return True, "✅ Gemini key is valid"
     except Exception as e:
-        return False, f"❌ Gemini key invalid: {str(e)}"
+        if _is_transient(e):
+            return False, f"❌ Could not reach Gemini: {_describe_error(e)}"
+        return False, f"❌ Gemini key invalid: {_describe_error(e)}"
+
+
+# =========================
+# Response cache
+# =========================
+# Final answers are stored on disk keyed by question and models, so
+# repeated questions skip the whole multi-model pipeline. Bump the version
+# whenever prompts or the pipeline change so stale answers are not served.
+_RESPONSE_CACHE_DIR = Path.home() / ".cache" / "mergemind"
+_RESPONSE_CACHE_TTL = 3600
+_RESPONSE_CACHE_VERSION = "v1"
+# Expired files are swept and the directory is capped at a fixed number
+# of entries (oldest first), at most once per sweep interval.
+_RESPONSE_CACHE_MAX_ENTRIES = 500
+_RESPONSE_CACHE_SWEEP_INTERVAL = 300
+_last_cache_sweep = 0.0
+
+# Questions whose answer depends on when they are asked are never cached.
+_UNCACHEABLE_RE = re.compile(
+    r"\b(current (time|date|year|weather|price|news)|today'?s?|right now|"
+    r"tonight|yesterday|tomorrow|this (week|month|year)|"
+    r"latest (version|release|news|update)s?)\b",
+    re.IGNORECASE
+)
+
+
+def _response_cache_key(user_question: str, openai_model: str, gemini_model: str):
+    if _UNCACHEABLE_RE.search(user_question):
+        return None
+    raw = f"{user_question}|{openai_model}|{gemini_model}|{_RESPONSE_CACHE_VERSION}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _load_cached_response(cache_key):
+    if cache_key is None:
+        return None
+    path = _RESPONSE_CACHE_DIR / f"{cache_key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if entry.get("expires_at", 0) < time.time():
+        path.unlink(missing_ok=True)
+        return None
+    return entry.get("answer")
+
+
+def _store_cached_response(cache_key, answer: str):
+    if cache_key is None or not answer:
+        return
+    path = _RESPONSE_CACHE_DIR / f"{cache_key}.json"
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        _RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(
+            json.dumps({"answer": answer, "expires_at": time.time() + _RESPONSE_CACHE_TTL}),
+            encoding="utf-8"
+        )
+        tmp_path.replace(path)
+    except OSError:
+        # The cache is best-effort; a read-only or full disk must not fail the request.
+        pass
+    _sweep_response_cache()
+
+
+def _sweep_response_cache():
+    global _last_cache_sweep
+    now = time.time()
+    if now - _last_cache_sweep < _RESPONSE_CACHE_SWEEP_INTERVAL:
+        return
+    _last_cache_sweep = now
+
+    entries = []
+    try:
+        for path in _RESPONSE_CACHE_DIR.iterdir():
+            try:
+                mtime = path.stat().st_mtime
+                # Files are written once, so mtime + TTL is their expiry.
+                if mtime + _RESPONSE_CACHE_TTL < now:
+                    path.unlink(missing_ok=True)
+                else:
+                    entries.append((mtime, path))
+            except OSError:
+                continue
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - _RESPONSE_CACHE_MAX_ENTRIES)]:
+            path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+# The prompts ask every model to end with this marker. Only the tail of a
+# reply is inspected, so the check does not rescan multi-KB answers.
+_TERM = "TERMINATE"
+_TERM_TAIL = 32
+
+
+def _strip_term(content: str) -> str:
+    """Drop the trailing TERMINATE marker from a model reply, if present."""
+    if not content:
+        return ""
+    head, tail = content[:-_TERM_TAIL], content[-_TERM_TAIL:].rstrip()
+    if not tail.endswith(_TERM):
+        return content
+    return (head + tail[:-len(_TERM)]).rstrip()
+
+
+# =========================
+# Pipeline stages
+# =========================
+# The topology is fixed (ChatGpt || Gemini -> Referee), so it is spelled
+# out as explicit SDK calls rather than routed through an agent framework:
+# each stage is a single request with no per-turn dispatch or logging.
+_ASSISTANT_SYS = (
+    "Write explanation and the most efficient code "
+    "in the language specified by the user.\n"
+    "Output MUST include a fenced code block.\n"
+    "End with: TERMINATE"
+)
+
+_REFEREE_SYS = (
+    "You are a senior judge.\n"
+    "Evaluate solutions from ChatGpt and Gemini.\n"
+    "Merge strengths and output the single best solution.\n"
+    "Provide explanation and final code only.\n"
+    "End with: TERMINATE"
+)
+
+_GEMINI_ASSISTANT_CONFIG = genai_types.GenerateContentConfig(
+    system_instruction=_ASSISTANT_SYS
+)
+
+
+async def _ask_chatgpt(api_key: str, model: str, user_question: str) -> str:
+    client = _get_async_openai_client(api_key)
+    response = await _with_retry(lambda: client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": _ASSISTANT_SYS},
+            {"role": "user", "content": user_question}
+        ]
+    ), timeout=_GENERATION_TIMEOUT, retry_timeouts=False)
+    return _strip_term(response.choices[0].message.content or "")
+
+
+async def _ask_gemini(api_key: str, model: str, user_question: str) -> str:
+    client = _get_gemini_client(api_key)
+    response = await _with_retry(lambda: client.aio.models.generate_content(
+        model=model,
+        contents=user_question,
+        config=_GEMINI_ASSISTANT_CONFIG
+    ), timeout=_GENERATION_TIMEOUT, retry_timeouts=False)
+    return _strip_term(response.text or "")
+
+
+async def _generate_candidates(calls):
+    """Await {name: coroutine} concurrently.
+
+    Returns (candidates, any_succeeded, all_succeeded).
+    """
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+
+    candidates = []
+    for name, result in zip(calls, results):
+        if isinstance(result, Exception):
+            candidates.append(f"### {name}\n❌ {name} failed: {_describe_error(result)}")
+        else:
+            candidates.append(f"### {name}\n{result}")
+
+    failures = [isinstance(result, Exception) for result in results]
+    return candidates, not all(failures), not any(failures)
+
+
+async def _merge_candidates(api_key: str, model: str, user_question: str, candidates):
+    """Stream the Referee's merged answer, yielding the accumulated text."""
+    referee_prompt = (
+        f"User question:\n{user_question}\n\n"
+        "Candidate solutions:\n\n" + "\n\n".join(candidates)
+    )
+    client = _get_async_openai_client(api_key)
+    stream = await _with_retry(lambda: client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": _REFEREE_SYS},
+            {"role": "user", "content": referee_prompt}
+        ],
+        stream=True
+    ), timeout=_GENERATION_TIMEOUT, retry_timeouts=False)
+
+    answer = ""
+    async for chunk in stream:
+        if chunk.choices:
+            answer += chunk.choices[0].delta.content or ""
+            yield answer
+
+    final_answer = _strip_term(answer)
+    if final_answer != answer:
+        yield final_answer
 
 
 # =========================
 # Main handler
 # =========================
-def autogen_chat_interface(
+async def autogen_chat_interface(
     user_question: str,
     openai_key: str,
     openai_model: str,
@@ -48,91 +383,133 @@ def autogen_chat_interface(
     gemini_model: str
 ):
     if not openai_key:
-        return "❌ **OpenAI API key is required.** Get your key here: [OpenAI Platform](https://platform.openai.com/api-keys)"
-
-    valid, msg = validate_openai_key(openai_key, openai_model)
-    if not valid:
-        return msg
+        yield "❌ **OpenAI API key is required.** Get your key here: [OpenAI Platform](https://platform.openai.com/api-keys)"
+        return
 
-    gemini_valid = False
+    # Both keys are checked concurrently; the OpenAI result is reported first.
+    validations = [validate_openai_key(openai_key, openai_model)]
     if gemini_key:
-        gemini_valid, gemini_msg = validate_gemini_key(gemini_key, gemini_model)
-        if not gemini_valid:
-            return gemini_msg
-
-    llm_config = {
-        "config_list": [{"model": openai_model, "api_key": openai_key}],
-        "cache_seed": 42
-    }
-
-    llm_config_gemini = None
-    if gemini_valid:
-        llm_config_gemini = {
-            "config_list": [
-                {"model": gemini_model, "api_key": gemini_key, "api_type": "google"}
-            ]
-        }
-
-    assistant1 = ConversableAgent(
-        name="ChatGpt",
-        system_message=(
-            "Write explanation and the most efficient code "
-            "in the language specified by the user.\n"
-            "Output MUST include a fenced code block.\n"
-            "End with: TERMINATE"
-        ),
-        llm_config=llm_config,
-        human_input_mode="NEVER"
+        validations.append(validate_gemini_key(gemini_key, gemini_model))
+    for valid, msg in await asyncio.gather(*validations):
+        if not valid:
+            yield msg
+            return
+
+    # Only looked up once the keys are known to be valid, so cached answers
+    # are never handed out for free. Repeat submissions hit the validation
+    # cache above and still make no network call.
+    cache_key = _response_cache_key(
+        user_question, openai_model, gemini_model if gemini_key else ""
     )
+    cached = _load_cached_response(cache_key)
+    if cached is not None:
+        yield cached
+        return
 
-    assistant2 = None
-    if llm_config_gemini:
-        assistant2 = ConversableAgent(
-            name="Gemini",
-            system_message=(
-                "Write explanation and the most efficient code "
-                "in the language specified by the user.\n"
-                "Output MUST include a fenced code block.\n"
-                "End with: TERMINATE"
-            ),
-            llm_config=llm_config_gemini,
-            human_input_mode="NEVER"
-        )
+    # With a single candidate there is nothing for the Referee to merge,
+    # so ChatGpt's answer is returned as-is.
+    if not gemini_key:
+        try:
+            answer = await _ask_chatgpt(openai_key, openai_model, user_question)
+        except Exception as e:
+            yield f"❌ ChatGpt failed: {_describe_error(e)}"
+            return
+        if not answer.strip():
+            yield "❌ ChatGpt returned an empty response. Please try again."
+            return
+        _store_cached_response(cache_key, answer)
+        yield answer
+        return
 
-    referee = ConversableAgent(
-        name="Referee",
-        system_message=(
-            "You are a senior judge.\n"
-            "Evaluate solutions from ChatGpt and Gemini.\n"
-            "Merge strengths and output the single best solution.\n"
-            "Provide explanation and final code only.\n"
-            "End with: TERMINATE"
-        ),
-        llm_config=llm_config,
-        human_input_mode="NEVER"
-    )
+    # Fan-out: both assistants answer the question concurrently.
+    candidates, any_succeeded, all_succeeded = await _generate_candidates({
+        "ChatGpt": _ask_chatgpt(openai_key, openai_model, user_question),
+        "Gemini": _ask_gemini(gemini_key, gemini_model, user_question)
+    })
+    if not any_succeeded:
+        yield "\n\n".join(candidates)
+        return
+
+    # Fan-in: the Referee streams the merged answer so the user sees it
+    # from the first token instead of after the whole pipeline.
+    answer = ""
+    try:
+        async for answer in _merge_candidates(openai_key, openai_model, user_question, candidates):
+            yield answer
+    except Exception as e:
+        # Keep whatever the Referee produced and fall back to the
+        # candidates, which are complete answers on their own.
+        sections = [f"❌ Referee failed: {_describe_error(e)}"]
+        if answer.strip():
+            sections.append(f"### Referee (partial)\n{answer}")
+        yield "\n\n".join(sections + candidates)
+        return
+
+    # An empty merge (e.g. the Referee only echoed the marker) must not
+    # wipe out the candidates that were already generated.
+    if not answer.strip():
+        yield "\n\n".join(candidates)
+        return
+
+    # A merge built around a failed candidate is a degraded answer; only
+    # cache runs where every stage succeeded.
+    if all_succeeded:
+        _store_cached_response(cache_key, answer)
+
+
+# =========================
+# Batch handler
+# =========================
+_BATCH_CONCURRENCY = 5
 
-    user_proxy = UserProxyAgent(
-        name="user_proxy",
-        human_input_mode="NEVER",
-        is_termination_msg=lambda x: x.get("content", "").rstrip().endswith("TERMINATE"),
-        code_execution_config=False
-    )
 
-    agents = [assistant1]
-    if assistant2:
-        agents.append(assistant2)
-    agents.append(referee)
+async def batch_chat_interface(
+    questions_text: str,
+    openai_key: str,
+    openai_model: str,
+    gemini_key: str,
+    gemini_model: str
+):
+    # One question per line; blank lines and repeated questions are dropped.
+    questions = list(dict.fromkeys(
+        line.strip() for line in (questions_text or "").splitlines() if line.strip()
+    ))
+    if not questions:
+        return "❌ **Enter at least one question, one per line.**"
+    if not openai_key:
+        return "❌ **OpenAI API key is required.** Get your key here: [OpenAI Platform](https://platform.openai.com/api-keys)"
+
+    # Validate once up front so the concurrent pipelines all hit the
+    # validation cache instead of each pinging the providers.
+    validations = [validate_openai_key(openai_key, openai_model)]
+    if gemini_key:
+        validations.append(validate_gemini_key(gemini_key, gemini_model))
+    for valid, msg in await asyncio.gather(*validations):
+        if not valid:
+            return msg
 
-    groupchat = GroupChat(agents=agents, messages=[], max_round=5)
-    manager = GroupChatManager(
-        groupchat=groupchat,
-        llm_config=llm_config,
-        is_termination_msg=lambda x: x.get("content", "").rstrip().endswith("TERMINATE")
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _answer(question: str) -> str:
+        async with semaphore:
+            answer = ""
+            async for answer in autogen_chat_interface(
+                question, openai_key, openai_model, gemini_key, gemini_model
+            ):
+                pass
+            return answer
+
+    answers = await asyncio.gather(
+        *(_answer(question) for question in questions),
+        return_exceptions=True
     )
 
-    user_proxy.initiate_chat(manager, message=user_question)
-    return groupchat.messages[-1]["content"]
+    sections = []
+    for index, (question, answer) in enumerate(zip(questions, answers), start=1):
+        if isinstance(answer, Exception):
+            answer = f"❌ Failed: {_describe_error(answer)}"
+        sections.append(f"## {index}. {question}\n\n{answer}")
+    return "\n\n---\n\n".join(sections)
 
 
 # =========================
@@ -381,213 +758,294 @@ custom_css = """
 
 """
 
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+# Minified once at import; Gradio embeds the stylesheet in every page load.
+custom_css = _minify_css(custom_css)
+
 # =========================
 # Premium Gradio UI
 # =========================
-with gr.Blocks(css=custom_css, theme=gr.themes.Soft()) as iface:
-    # Header Section
-    with gr.Column(elem_classes="header-container"):
-        gr.HTML("""
-            <div style="text-align: center; color: white;">
-                <h1 style="font-size: 3.5em; font-weight: 900; margin: 0; 
-                           background: linear-gradient(135deg, #ffffff 0%, #a8d8ff 100%);
-                           -webkit-background-clip: text;
-                           -webkit-text-fill-color: transparent;">
-                    ⚡ MergeMind
-                </h1>
-                <p style="font-size: 1.3em; margin: 10px 0; opacity: 0.9; color: white;">
-                    Multi-Model AI Code Generator
-                </p>
-            </div>
-        """)
-        
-        with gr.Row():
-            with gr.Column(scale=1):
-                gr.HTML("""
-                    <div class="feature-item">
-                        <div style="font-size: 2em; margin-bottom: 5px; color: white;">🔐</div>
-                        <strong style="color: white;">Secure</strong><br/>
-                        <small style="color: white;">Your keys stay private</small>
-                    </div>
-                """)
-            with gr.Column(scale=1):
-                gr.HTML("""
-                    <div class="feature-item">
-                        <div style="font-size: 2em; margin-bottom: 5px; color: white;">🧠</div>
-                        <strong style="color: white;">Multi-Model</strong><br/>
-                        <small style="color: white;">GPT + Gemini power</small>
-                    </div>
-                """)
-            with gr.Column(scale=1):
-                gr.HTML("""
-                    <div class="feature-item">
-                        <div style="font-size: 2em; margin-bottom: 5px; color: white;">🏆</div>
-                        <strong style="color: white;">Best Results</strong><br/>
-                        <small style="color: white;">AI referee judges quality</small>
-                    </div>
-                """)
-            with gr.Column(scale=1):
-                gr.HTML("""
-                    <div class="feature-item">
-                        <div style="font-size: 2em; margin-bottom: 5px; color: white;">⚡</div>
-                        <strong style="color: white;">Fast</strong><br/>
-                        <small style="color: white;">Instant code generation</small>
-                    </div>
-                """)
-    
-    # Main Content
-    with gr.Row():
-        # Left Column - Inputs
-        with gr.Column(scale=1, elem_classes="input-section"):
-            gr.HTML('<h3 style="color: #000c09; margin-bottom: 15px;">💬 Your Coding Question</h3>')
-            question_input = gr.Textbox(
-                lines=4, 
-                placeholder="e.g., Write a Python function to sort a list using quicksort...",
-                label="",
-                show_label=False
-            )
-            
-            gr.HTML('<h3 style="color: #000000; margin-top: 20px; margin-bottom: 15px;">🔑 OpenAI Configuration</h3>')
-            openai_key_input = gr.Textbox(
-                label="OPENAI_API_KEY", 
-                type="password",
-                placeholder="sk-..."
-            )
+_UI_CONCURRENCY = 10
+
+
+def _build_ui():
+    """Build the Gradio app; gradio is imported here so importing this
+    module for programmatic use does not pay its startup cost."""
+    import gradio as gr
+
+    with gr.Blocks(css=custom_css, theme=gr.themes.Soft()) as iface:
+        # Header Section
+        with gr.Column(elem_classes="header-container"):
             gr.HTML("""
-                <div class="api-helper">
-                    <span style="color: white;">Don't have an API key?</span><br/>
-                    <a href="https://platform.openai.com/api-keys" target="_blank" style="color: white;">
-                        🔗 Get Your OpenAI API Key Here
-                    </a>
+                <div style="text-align: center; color: white;">
+                    <h1 style="font-size: 3.5em; font-weight: 900; margin: 0; 
+                               background: linear-gradient(135deg, #ffffff 0%, #a8d8ff 100%);
+                               -webkit-background-clip: text;
+                               -webkit-text-fill-color: transparent;">
+                        ⚡ MergeMind
+                    </h1>
+                    <p style="font-size: 1.3em; margin: 10px 0; opacity: 0.9; color: white;">
+                        Multi-Model AI Code Generator
+                    </p>
                 </div>
             """)
+        
+            with gr.Row():
+                with gr.Column(scale=1):
+                    gr.HTML("""
+                        <div class="feature-item">
+                            <div style="font-size: 2em; margin-bottom: 5px; color: white;">🔐</div>
+                            <strong style="color: white;">Secure</strong><br/>
+                            <small style="color: white;">Your keys stay private</small>
+                        </div>
+                    """)
+                with gr.Column(scale=1):
+                    gr.HTML("""
+                        <div class="feature-item">
+                            <div style="font-size: 2em; margin-bottom: 5px; color: white;">🧠</div>
+                            <strong style="color: white;">Multi-Model</strong><br/>
+                            <small style="color: white;">GPT + Gemini power</small>
+                        </div>
+                    """)
+                with gr.Column(scale=1):
+                    gr.HTML("""
+                        <div class="feature-item">
+                            <div style="font-size: 2em; margin-bottom: 5px; color: white;">🏆</div>
+                            <strong style="color: white;">Best Results</strong><br/>
+                            <small style="color: white;">AI referee judges quality</small>
+                        </div>
+                    """)
+                with gr.Column(scale=1):
+                    gr.HTML("""
+                        <div class="feature-item">
+                            <div style="font-size: 2em; margin-bottom: 5px; color: white;">⚡</div>
+                            <strong style="color: white;">Fast</strong><br/>
+                            <small style="color: white;">Instant code generation</small>
+                        </div>
+                    """)
+    
+        # Main Content
+        with gr.Tabs():
+            with gr.Tab("💬 Single Question"):
+                with gr.Row():
+                    # Left Column - Inputs
+                    with gr.Column(scale=1, elem_classes="input-section"):
+                        gr.HTML('<h3 style="color: #000c09; margin-bottom: 15px;">💬 Your Coding Question</h3>')
+                        question_input = gr.Textbox(
+                            lines=4, 
+                            placeholder="e.g., Write a Python function to sort a list using quicksort...",
+                            label="",
+                            show_label=False
+                        )
             
-            openai_model_input = gr.Dropdown(
-                label="Model",
-                choices=["gpt-3.5-turbo", "gpt-4o", "gpt-4o-mini", "gpt-5", "gpt-5.1", "gpt-5.2"],
-                value="gpt-3.5-turbo"
-            )
+                        gr.HTML('<h3 style="color: #000000; margin-top: 20px; margin-bottom: 15px;">🔑 OpenAI Configuration</h3>')
+                        openai_key_input = gr.Textbox(
+                            label="OPENAI_API_KEY", 
+                            type="password",
+                            placeholder="sk-..."
+                        )
+                        gr.HTML("""
+                            <div class="api-helper">
+                                <span style="color: white;">Don't have an API key?</span><br/>
+                                <a href="https://platform.openai.com/api-keys" target="_blank" style="color: white;">
+                                    🔗 Get Your OpenAI API Key Here
+                                </a>
+                            </div>
+                        """)
             
-            gr.HTML('<h3 style="color: #000000; margin-top: 20px; margin-bottom: 15px;">🌟 Gemini Configuration (Optional)</h3>')
-            gemini_key_input = gr.Textbox(
-                label="GOOGLE_API_KEY",
-                type="password",
-                placeholder="Optional - Leave empty to use only GPT"
-            )
-            gr.HTML("""
-                <div class="api-helper" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);">
-                    <a href="https://makersuite.google.com/app/apikey" target="_blank" style="color: white;">
-                        🔗 Get Gemini API Key
-                    </a>
-                </div>
-            """)
+                        openai_model_input = gr.Dropdown(
+                            label="Model",
+                            choices=list(_OPENAI_MODELS),
+                            value="gpt-3.5-turbo"
+                        )
             
-            gemini_model_input = gr.Dropdown(
-                label="Model",
-                choices=["gemini-1.5-flash", "gemini-1.5-pro", "gemini-3-flash-preview", "gemini-2.5-flash"],
-                value="gemini-1.5-flash"
-            )
+                        gr.HTML('<h3 style="color: #000000; margin-top: 20px; margin-bottom: 15px;">🌟 Gemini Configuration (Optional)</h3>')
+                        gemini_key_input = gr.Textbox(
+                            label="GOOGLE_API_KEY",
+                            type="password",
+                            placeholder="Optional - Leave empty to use only GPT"
+                        )
+                        gr.HTML("""
+                            <div class="api-helper" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);">
+                                <a href="https://makersuite.google.com/app/apikey" target="_blank" style="color: white;">
+                                    🔗 Get Gemini API Key
+                                </a>
+                            </div>
+                        """)
             
-            submit_btn = gr.Button(
-                "🚀 Generate Solution", 
-                variant="primary",
-                size="lg",
-                elem_classes="generate-btn"
-            )
+                        gemini_model_input = gr.Dropdown(
+                            label="Model",
+                            choices=list(_GEMINI_MODELS),
+                            value="gemini-2.5-flash"
+                        )
+            
+                        submit_btn = gr.Button(
+                            "🚀 Generate Solution", 
+                            variant="primary",
+                            size="lg",
+                            elem_classes="generate-btn"
+                        )
         
-        # Right Column - Output
-        with gr.Column(scale=1, elem_classes="output-section"):
-            gr.HTML("""
-                <div style="text-align: center; margin-bottom: 25px;">
-                    <div style="display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                padding: 15px 40px; border-radius: 50px; box-shadow: 0 8px 25px rgba(102,126,234,0.3);">
-                        <h3 style="margin: 0; color: white; font-size: 1.5em; font-weight: 700;">
-                            ✨ Generated Solution
-                        </h3>
-                    </div>
-                </div>
-            """)
+                    # Right Column - Output
+                    with gr.Column(scale=1, elem_classes="output-section"):
+                        gr.HTML("""
+                            <div style="text-align: center; margin-bottom: 25px;">
+                                <div style="display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                                            padding: 15px 40px; border-radius: 50px; box-shadow: 0 8px 25px rgba(102,126,234,0.3);">
+                                    <h3 style="margin: 0; color: white; font-size: 1.5em; font-weight: 700;">
+                                        ✨ Generated Solution
+                                    </h3>
+                                </div>
+                            </div>
+                        """)
             
+                        gr.HTML("""
+                            <div style="background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+                                        padding: 40px; border-radius: 15px; margin-bottom: 20px;
+                                        border: 3px dashed rgba(102,126,234,0.3);
+                                        min-height: 350px; display: flex; align-items: center; justify-content: center;">
+                                <div style="text-align: center;">
+                                    <div style="font-size: 5em; margin-bottom: 20px; opacity: 0.3;">🤖</div>
+                                    <p style="font-size: 1.2em; color: #667eea; font-weight: 600; margin: 0;">
+                                        Waiting for your question...
+                                    </p>
+                                    <p style="color: #666; margin-top: 10px; font-size: 0.95em;">
+                                        Enter your coding question and click "Generate Solution"
+                                    </p>
+                                    <div style="margin-top: 25px; display: flex; gap: 15px; justify-content: center; flex-wrap: wrap;">
+                                        <span style="background: white; padding: 8px 16px; border-radius: 20px; 
+                                                     font-size: 0.9em; color: #667eea; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+                                            💡 Smart Analysis
+                                        </span>
+                                        <span style="background: white; padding: 8px 16px; border-radius: 20px; 
+                                                     font-size: 0.9em; color: #764ba2; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+                                            ⚡ Fast Results
+                                        </span>
+                                        <span style="background: white; padding: 8px 16px; border-radius: 20px; 
+                                                     font-size: 0.9em; color: #f093fb; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+                                            🎯 Best Quality
+                                        </span>
+                                    </div>
+                                </div>
+                            </div>
+                        """)
+            
+                        output = gr.Markdown(
+                            value="",
+                            label="",
+                            show_label=False,
+                            elem_classes="output-markdown"
+                        )
+
+            with gr.Tab("📚 Batch Mode"):
+                with gr.Row():
+                    with gr.Column(scale=1, elem_classes="input-section"):
+                        gr.HTML('<h3 style="color: #000000; margin-bottom: 15px;">📚 Your Coding Questions</h3>')
+                        batch_questions_input = gr.Textbox(
+                            lines=10,
+                            placeholder="One question per line, e.g.:\nWrite a Python quicksort\nReverse a linked list in Java",
+                            label="",
+                            show_label=False
+                        )
+                        gr.HTML("""
+                            <p style="color: #000000; margin-top: 10px;">
+                                Uses the API keys and models configured in the Single Question tab.
+                            </p>
+                        """)
+                        batch_submit_btn = gr.Button(
+                            "🚀 Generate All Solutions",
+                            variant="primary",
+                            size="lg",
+                            elem_classes="generate-btn"
+                        )
+
+                    with gr.Column(scale=1, elem_classes="output-section"):
+                        batch_output = gr.Markdown(
+                            value="",
+                            label="",
+                            show_label=False,
+                            elem_classes="output-markdown"
+                        )
+
+        # Footer Section
+        with gr.Column(elem_classes="footer-container"):
             gr.HTML("""
-                <div style="background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-                            padding: 40px; border-radius: 15px; margin-bottom: 20px;
-                            border: 3px dashed rgba(102,126,234,0.3);
-                            min-height: 350px; display: flex; align-items: center; justify-content: center;">
-                    <div style="text-align: center;">
-                        <div style="font-size: 5em; margin-bottom: 20px; opacity: 0.3;">🤖</div>
-                        <p style="font-size: 1.2em; color: #667eea; font-weight: 600; margin: 0;">
-                            Waiting for your question...
-                        </p>
-                        <p style="color: #666; margin-top: 10px; font-size: 0.95em;">
-                            Enter your coding question and click "Generate Solution"
-                        </p>
-                        <div style="margin-top: 25px; display: flex; gap: 15px; justify-content: center; flex-wrap: wrap;">
-                            <span style="background: white; padding: 8px 16px; border-radius: 20px; 
-                                         font-size: 0.9em; color: #667eea; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                                💡 Smart Analysis
-                            </span>
-                            <span style="background: white; padding: 8px 16px; border-radius: 20px; 
-                                         font-size: 0.9em; color: #764ba2; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                                ⚡ Fast Results
-                            </span>
-                            <span style="background: white; padding: 8px 16px; border-radius: 20px; 
-                                         font-size: 0.9em; color: #f093fb; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                                🎯 Best Quality
-                            </span>
-                        </div>
+                <div style="color: white;">
+                    <h3 style="margin: 0 0 15px 0; font-size: 1.5em; color: white;">
+                        👨‍💻 Created by Amit Kumar
+                    </h3>
+                    <p style="opacity: 0.9; margin-bottom: 20px; color: white;">
+                        Empowering developers with AI-powered code generation
+                    </p>
+                    <div class="social-links">
+                        <a href="mailto:amit12112012@gmail.com" class="social-link" target="_blank">
+                            <span style="font-size: 1.3em;">📧</span>
+                            <span style="color: white; margin-left: 8px;">amit12112012@gmail.com</span>
+                        </a>
+                        <a href="https://www.linkedin.com/in/amit-kumar-546267265/" class="social-link" target="_blank">
+                            <span style="font-size: 1.3em;">💼</span>
+                            <span style="color: white; margin-left: 8px;">LinkedIn Profile</span>
+                        </a>
+                        <a href="https://github.com/amitkumar010715" class="social-link" target="_blank">
+                            <span style="font-size: 1.3em;">🐙</span>
+                            <span style="color: white; margin-left: 8px;">GitHub @amitkumar010715</span>
+                        </a>
                     </div>
+                    <p style="margin-top: 20px; opacity: 0.7; font-size: 0.9em; color: white;">
+                        🔒 API keys never stored • 🗂️ Answers cached for 1 hour • 🚫 No flagging
+                    </p>
                 </div>
             """)
-            
-            output = gr.Markdown(
-                value="",
-                label="",
-                show_label=False,
-                elem_classes="output-markdown"
-            )
     
-    # Footer Section
-    with gr.Column(elem_classes="footer-container"):
-        gr.HTML("""
-            <div style="color: white;">
-                <h3 style="margin: 0 0 15px 0; font-size: 1.5em; color: white;">
-                    👨‍💻 Created by Amit Kumar
-                </h3>
-                <p style="opacity: 0.9; margin-bottom: 20px; color: white;">
-                    Empowering developers with AI-powered code generation
-                </p>
-                <div class="social-links">
-                    <a href="mailto:amit12112012@gmail.com" class="social-link" target="_blank">
-                        <span style="font-size: 1.3em;">📧</span>
-                        <span style="color: white; margin-left: 8px;">amit12112012@gmail.com</span>
-                    </a>
-                    <a href="https://www.linkedin.com/in/amit-kumar-546267265/" class="social-link" target="_blank">
-                        <span style="font-size: 1.3em;">💼</span>
-                        <span style="color: white; margin-left: 8px;">LinkedIn Profile</span>
-                    </a>
-                    <a href="https://github.com/amitkumar010715" class="social-link" target="_blank">
-                        <span style="font-size: 1.3em;">🐙</span>
-                        <span style="color: white; margin-left: 8px;">GitHub @amitkumar010715</span>
-                    </a>
-                </div>
-                <p style="margin-top: 20px; opacity: 0.7; font-size: 0.9em; color: white;">
-                    🔒 No data storage • 🚫 No flagging • ✅ 100% Secure
-                </p>
-            </div>
-        """)
-    
-    # Event Handler
-    submit_btn.click(
-        fn=autogen_chat_interface,
-        inputs=[
-            question_input,
-            openai_key_input,
-            openai_model_input,
-            gemini_key_input,
-            gemini_model_input
-        ],
-        outputs=output
-    )
+        # Event Handler
+        submit_btn.click(
+            fn=autogen_chat_interface,
+            inputs=[
+                question_input,
+                openai_key_input,
+                openai_model_input,
+                gemini_key_input,
+                gemini_model_input
+            ],
+            outputs=output,
+            concurrency_limit=_UI_CONCURRENCY
+        )
+
+        batch_submit_btn.click(
+            fn=batch_chat_interface,
+            inputs=[
+                batch_questions_input,
+                openai_key_input,
+                openai_model_input,
+                gemini_key_input,
+                gemini_model_input
+            ],
+            outputs=batch_output,
+            # Each batch already fans out up to _BATCH_CONCURRENCY pipelines.
+            concurrency_limit=2
+        )
+
+    # The handlers are async and network-bound, so many requests can be in
+    # flight at once instead of queueing behind a single worker.
+    iface.queue(default_concurrency_limit=_UI_CONCURRENCY, max_size=64)
+    return iface
+
 
 # Launch the app
-iface.launch(debug=True, share=True)
\ No newline at end of file
+# Debug mode and the public gradio.live tunnel are opt-in for local
+# development (DEV=1, SHARE=1); deployments serve clients directly.
+if __name__ == "__main__":
+    _build_ui().launch(
+        debug=os.getenv("DEV") == "1",
+        share=os.getenv("SHARE") == "1",
+        server_name="0.0.0.0"
+    )
\ No newline at end of file